@@ -2,6 +2,7 @@
 Responsible for parsing the command line attributes
 """
 import argparse
+import functools
 import importlib
 import inspect
 import os
@@ -21,13 +22,94 @@ else:
 VERSION = metadata.version("clinguin")
 
 
+def _scandir_recursive(path, module=""):
+    """
+    Yields a tuple (entry, module) for every file below path, where module is the
+    dotted module path of the directory containing the file.
+    Uses the type information cached in the DirEntry to avoid additional stat calls.
+    Subdirectories that cannot be read are skipped.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sub_module = f"{module}.{entry.name}" if module else entry.name
+                try:
+                    yield from _scandir_recursive(entry.path, sub_module)
+                except PermissionError:
+                    pass
+            elif entry.is_file(follow_symlinks=False):
+                yield entry, module
+
+
+@functools.lru_cache(maxsize=None)
+def _collect_subclasses(root):
+    """
+    Returns a tuple with all (direct and indirect) subclasses of root,
+    the direct subclasses first, followed by the subclasses of each of them.
+    The result is cached, call ''_collect_subclasses.cache_clear()'' after importing new classes.
+    """
+    sub_classes = root.__subclasses__()
+    recursive = []
+    for sub_class in sub_classes:
+        recursive.extend(_collect_subclasses(sub_class))
+    return tuple(sub_classes + recursive)
+
+
+_BACKEND_HELP = textwrap.dedent(
+    """\
+    Optionally specify which backend to use using the class name.
+    =>  Available options: {{{options}}}
+    """
+)
+
+_FRONTEND_HELP = textwrap.dedent(
+    """\
+    Optionally specify which frontend to use using the class name.
+    =>  Available options: {{{options}}}
+    """
+)
+
+
+class _FastArgumentParser(argparse.ArgumentParser):
+    """
+    argparse.ArgumentParser that reuses a single formatter for the metavar/help validation
+    done in ''add_argument'', instead of constructing a new HelpFormatter for every argument.
+    Formatting the help or usage still uses a fresh formatter.
+    """
+
+    _cached_formatter = None
+    _validating = False
+
+    def _get_formatter(self):
+        if not self._validating:
+            return super()._get_formatter()
+        if self._cached_formatter is None:
+            self._cached_formatter = super()._get_formatter()
+        return self._cached_formatter
+
+    def add_argument(self, *args, **kwargs):
+        self._validating = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._validating = False
+
+    def format_usage(self):
+        self._cached_formatter = None
+        return super().format_usage()
+
+    def format_help(self):
+        self._cached_formatter = None
+        return super().format_help()
+
+
 class ArgumentParser:
     """
     ArgumentParser-Class, Responsible for parsing the command line attributes
     """
 
-    default_backend_exec_string = "from .server.application.backends import *"
-    default_frontend_exec_string = "from .client.presentation.frontends import *"
+    default_backends_module = "clinguin.server.application.backends"
+    default_frontends_module = "clinguin.client.presentation.frontends"
 
     default_backend = "ClingoMultishotBackend"
     default_frontend = "AngularFrontend"
@@ -36,11 +118,6 @@ class ArgumentParser:
         self.frontend_name = None
         self.frontend = None
 
-        self.titles = {
-            "client": self._client_title,
-            "server": self._server_title,
-            "client-server": self._client_server_title,
-        }
         self.descriptions = {
             "client": "Start a client process that will render a UI.",
             "server": "Start server process making endpoints available for a client.",
@@ -56,7 +133,7 @@ class ArgumentParser:
         """
         self._parse_custom_classes(string_args)
 
-        parser = argparse.ArgumentParser(
+        parser = _FastArgumentParser(
             description=self._clinguin_description(process),
             add_help=True,
             formatter_class=argparse.RawTextHelpFormatter,
@@ -68,6 +145,7 @@ class ArgumentParser:
             title="Process type",
             description="The type of process to start: a client (UI) a server (Backend) or both",
             dest="process",
+            parser_class=_FastArgumentParser,
         )
         self._create_client_subparser(subparsers)
         self._create_server_subparser(subparsers)
@@ -83,9 +161,7 @@ class ArgumentParser:
         args.backend = self.backend
         args.frontend = self.frontend
 
-    @property
-    def _clinguin_title(self):
-        return """
+    _clinguin_title = """
               ___| (_)_ __   __ _ _   _(_)_ __
              / __| | | '_ \\ / _` | | | | | '_ \\
             | (__| | | | | | (_| | |_| | | | | |
@@ -93,101 +169,84 @@ class ArgumentParser:
                             |___/
             """
 
-    @property
-    def _client_server_title(self):
-        return """
+    _client_server_title = """
              _ | o  _  ._  _|_     _  _  ._     _  ._
             (_ | | (/_ | |  |_    _> (/_ |  \\/ (/_ |
 
             """
 
-    @property
-    def _client_title(self):
-        return """
+    _client_title = """
                        _ | o  _  ._  _|_
                       (_ | | (/_ | |  |_
 
             """
 
-    @property
-    def _server_title(self):
-        return """
+    _server_title = """
                        _  _  ._     _  ._
                       _> (/_ |  \\/ (/_ |
 
             """
 
+    _description = (
+        "Clinguin is a GUI language extension for a logic program that uses Clingo."
+    )
+
+    # Headers of the help texts, cleaned once when the class is created
+    _clean_titles = {
+        None: inspect.cleandoc(_clinguin_title + _description),
+        "client": inspect.cleandoc(_clinguin_title + _client_title),
+        "server": inspect.cleandoc(_clinguin_title + _server_title),
+        "client-server": inspect.cleandoc(_clinguin_title + _client_server_title),
+    }
+
     def _clinguin_description(self, process):
-        description = (
-            "Clinguin is a GUI language extension for a logic program that uses Clingo."
-        )
+        description = ArgumentParser._description
         if process not in ["server", "client", "client-server"]:
-            ascci = f"{self._clinguin_title}{description}"
-            return_value = f"{inspect.cleandoc(ascci)}\n\n{description}"
-        else:
-            ascci = f"{self._clinguin_title}{self.titles[process]}"
-            return_value = f"{inspect.cleandoc(ascci)}\n\n{description}\n{self.descriptions[process]}"
-
-        return return_value
+            return f"{ArgumentParser._clean_titles[None]}\n\n{description}"
+        return f"{ArgumentParser._clean_titles[process]}\n\n{description}\n{self.descriptions[process]}"
 
     def _import_classes(self, path):
         if os.path.isfile(path):
             sys.path.append(os.path.dirname(path))
-            self._import_files_from_path_array([path])
+            self._import_module(os.path.basename(path))
         else:
             sys.path.append(path)
-            self._recursive_import(path, "", "")
-
-    def _import_files_from_path_array(self, file_paths, module=""):
-        for file_path in file_paths:
-            base = os.path.basename(file_path)
-            file_name = os.path.splitext(base)[0]
-            ending = os.path.splitext(base)[1]
-            if ending == ".py":
-                if module != "":
-                    try:
-                        importlib.import_module(module + "." + file_name)
-                    except Exception as ex:
-                        raise Exception(
-                            "Could not import module: " + module + "." + file_name
-                        ) from ex
-                else:
-                    importlib.import_module(file_name)
-
-    def _recursive_import(self, full_path, rec_path, module):
-        folder_paths = []
-        file_paths = []
+            self._recursive_import(path)
+
+    def _import_module(self, file_name, module=""):
+        if not file_name.endswith(".py"):
+            return
+        if module != "":
+            # A package's __init__.py is imported as the package itself
+            if file_name == "__init__.py":
+                module_name = module
+            else:
+                module_name = f"{module}.{file_name[:-3]}"
+            try:
+                importlib.import_module(module_name)
+            except Exception as ex:
+                raise Exception("Could not import module: " + module_name) from ex
+        else:
+            importlib.import_module(file_name[:-3])
 
+    def _recursive_import(self, full_path):
         try:
-            for entity in os.scandir(os.path.join(full_path, rec_path)):
-                if entity.is_dir():
-                    folder_paths.append(entity.path)
-                elif entity.is_file():
-                    file_paths.append(entity.path)
+            entries = list(_scandir_recursive(full_path))
         except Exception as ex:
             print("<<<BEGIN-STACK-TRACE>>>")
             traceback.print_exc()
             print("<<<END-STACK-TRACE>>>")
             raise Exception(
                 "Could not find path for importing libraries: "
-                + os.path.join(full_path, rec_path)
+                + full_path
                 + ". Therefore program is terminating now (full stacktrace is printed below)."
             ) from ex
 
-        self._import_files_from_path_array(file_paths)
-
-        for folder_path in folder_paths:
-            base = os.path.basename(folder_path)
-            new_module = module
-            if new_module != "":
-                new_module = new_module + "." + base
-            else:
-                new_module = base
-
-            self._recursive_import(full_path, os.path.join(rec_path, base), new_module)
+        for entry, module in entries:
+            self._import_module(entry.name, module)
 
     def _parse_custom_classes(self, str_args):
-        custom_imports_parser = argparse.ArgumentParser(add_help=False)
+        custom_imports_parser = _FastArgumentParser(add_help=False)
         self._add_default_arguments_to_backend_parser(custom_imports_parser)
         self._add_default_arguments_to_client_parser(custom_imports_parser)
 
@@ -198,8 +257,15 @@ class ArgumentParser:
         if args.custom_classes:
             self._import_classes(args.custom_classes)
 
-        exec(ArgumentParser.default_backend_exec_string)
-        exec(ArgumentParser.default_frontend_exec_string)
+        # Importing the default classes registers them as subclasses;
+        # the backends package loads its modules lazily on attribute access
+        backends = importlib.import_module(ArgumentParser.default_backends_module)
+        for backend_name in backends.__all__:
+            getattr(backends, backend_name)
+        importlib.import_module(ArgumentParser.default_frontends_module)
+        _collect_subclasses.cache_clear()
+        self.__dict__.pop("_backend_options_help", None)
+        self.__dict__.pop("_frontend_options_help", None)
 
         if args.frontend_syntax and not args.frontend_syntax_full:
             self._show_frontend_syntax = ShowFrontendSyntaxEnum.SHOW
@@ -305,19 +371,23 @@ class ArgumentParser:
 
         return parser_server_client
 
+    @functools.cached_property
+    def _backend_options_help(self):
+        options = "|".join([s.__name__ for s in _collect_subclasses(ClingoBackend)])
+        return _BACKEND_HELP.format(options=options)
+
+    @functools.cached_property
+    def _frontend_options_help(self):
+        options = "|".join(
+            [s.__name__ for s in _collect_subclasses(AbstractFrontend)]
+        )
+        return _FRONTEND_HELP.format(options=options)
+
     def _add_default_arguments_to_backend_parser(self, parser):
-        sub_classes = self._get_sub_classes(ClingoBackend)
-        sub_class_as_options = "|".join([s.__name__ for s in sub_classes])
-        sub_classes_str = "=>  Available options: {" + sub_class_as_options + "}"
         parser.add_argument(
             "--backend",
             type=str,
-            help=textwrap.dedent(
-                f"""\
-                Optionally specify which backend to use using the class name.
-                {sub_classes_str}
-                """
-            ),
+            help=self._backend_options_help,
             metavar="",
         )
         parser.add_argument(
@@ -331,18 +401,10 @@ class ArgumentParser:
         )
 
     def _add_default_arguments_to_client_parser(self, parser):
-        sub_classes = self._get_sub_classes(AbstractFrontend)
-        sub_class_as_options = "|".join([s.__name__ for s in sub_classes])
-        sub_classes_str = "=>  Available options: {" + sub_class_as_options + "}"
         parser.add_argument(
             "--frontend",
             type=str,
-            help=textwrap.dedent(
-                f"""\
-                Optionally specify which frontend to use using the class name.
-                {sub_classes_str}
-                """
-            ),
+            help=self._frontend_options_help,
             metavar="",
         )
         parser.add_argument(
@@ -401,12 +463,7 @@ class ArgumentParser:
         )
 
     def _get_sub_classes(self, cur_class):
-        sub_classes = cur_class.__subclasses__()
-        recursive = []
-        for sub_class in sub_classes:
-            recursive.extend(self._get_sub_classes(sub_class))
-
-        return sub_classes + recursive
+        return _collect_subclasses(cur_class)
 
     def _select_subclass_and_add_custom_arguments(
         self, parser, parent, class_name, default_class
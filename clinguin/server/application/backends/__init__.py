@@ -1,19 +1,52 @@
 """
 Module that contains the default backends ClingoMultishotBackend, ClingraphBackend and TemporalBackend.
+
+The backends are loaded lazily on first attribute access,
+so that only the modules of the backend that is actually used are imported.
 """
 # pylint: disable=cyclic-import
-from clinguin.server.application.backends.clingo_backend import ClingoBackend
-from clinguin.server.application.backends.clingo_multishot_backend import (
-    ClingoMultishotBackend,
-)
-from clinguin.server.application.backends.clingodl_backend import ClingoDLBackend
-from clinguin.server.application.backends.clingraph_backend import ClingraphBackend
-from clinguin.server.application.backends.explanation_backend import ExplanationBackend
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from clinguin.server.application.backends.clingo_backend import ClingoBackend
+    from clinguin.server.application.backends.clingo_multishot_backend import (
+        ClingoMultishotBackend,
+    )
+    from clinguin.server.application.backends.clingodl_backend import ClingoDLBackend
+    from clinguin.server.application.backends.clingraph_backend import (
+        ClingraphBackend,
+    )
+    from clinguin.server.application.backends.explanation_backend import (
+        ExplanationBackend,
+    )
+
+# Kept in import order, since it defines the order of the options listed in --backend
+_LAZY = {
+    "ClingoBackend": "clinguin.server.application.backends.clingo_backend",
+    "ClingoMultishotBackend": "clinguin.server.application.backends.clingo_multishot_backend",
+    "ClingoDLBackend": "clinguin.server.application.backends.clingodl_backend",
+    "ClingraphBackend": "clinguin.server.application.backends.clingraph_backend",
+    "ExplanationBackend": "clinguin.server.application.backends.explanation_backend",
+}
 
 __all__ = [
-    ClingoMultishotBackend.__name__,
-    ClingraphBackend.__name__,
-    ExplanationBackend.__name__,
-    ClingoBackend.__name__,
-    ClingoDLBackend.__name__,
+    "ClingoBackend",
+    "ClingoMultishotBackend",
+    "ClingoDLBackend",
+    "ClingraphBackend",
+    "ExplanationBackend",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    mod = importlib.import_module(_LAZY[name])
+    obj = getattr(mod, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
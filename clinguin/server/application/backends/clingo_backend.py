@@ -3,19 +3,31 @@
 Module that contains the ClingoMultishotBackend.
 """
 import logging
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from clingo import Control, parse_term
 from clingo.script import enable_python
 
 from clinguin.server import StandardJsonEncoder, UIState
-from clinguin.server.data.domain_state import solve, tag
+from clinguin.server.data.domain_state import solve
 
 enable_python()
 # pylint: disable=attribute-defined-outside-init
 
 
+@lru_cache(maxsize=1024)
+def _is_term(value):
+    """
+    Checks whether the string can be parsed by clingo into a term.
+    The result is cached, since the same context values are sent on every interaction.
+    """
+    try:
+        return parse_term(value) is not None
+    except Exception:
+        return False
+
+
 class ClingoBackend:
     """
     The ClingoBackend contains the basic clingo functionality for a backend using clingo.
@@ -286,11 +298,7 @@ class ClingoBackend:
         prg = ""
         for a in self.context:
             value = str(a.value)
-            try:
-                symbol = parse_term(value)
-            except Exception:
-                symbol = None
-            if symbol is None:
+            if not _is_term(value):
                 value = f'"{value}"'
             prg += f"_clinguin_context({str(a.key)},{value})."
         return prg
@@ -323,7 +331,7 @@ class ClingoBackend:
                 if "_ds_brave" in self._backup_ds_cache
                 else ""
             )
-        return "\n".join([str(s) + "." for s in list(tag(symbols, "_any"))])
+        return "\n".join([f"_any({s})." for s in symbols])
 
     @cached_property
     def _ds_cautious(self):
@@ -353,7 +361,7 @@ class ClingoBackend:
                 if "_ds_cautious" in self._backup_ds_cache
                 else ""
             )
-        return "\n".join([str(s) + "." for s in list(tag(symbols, "_all"))])
+        return "\n".join([f"_all({s})." for s in symbols])
 
     @cached_property
     def _ds_model(self):
@@ -382,7 +390,7 @@ class ClingoBackend:
                 )
             self._model = symbols
 
-        return "\n".join([str(s) + "." for s in self._model])
+        return UIState.symbols_to_facts(self._model)
 
     @property
     def _ds_unsat(self):
@@ -486,9 +494,13 @@ class ClingoBackend:
                     ctl.load(f)
             ctl.add("base", [], show_prg.replace('"', ""))
             ctl.ground([("base", [])])
-            with ctl.solve(yield_=True) as hnd:
-                for m in hnd:
-                    atoms = [f"{str(s)}." for s in m.symbols(shown=True)]
+            atoms = []
+
+            def on_model(m):
+                # Only the last model is written, as in optimization it is the best one
+                atoms[:] = [f"{str(s)}." for s in m.symbols(shown=True)]
+
+            ctl.solve(on_model=on_model)
 
             prg = "\n".join(atoms)
 
@@ -259,7 +259,10 @@ class ClingraphBackend(ClingoMultishotBackend):
         Arguments:
             graphs (dic) The computed graphs
         """
-        attributes = list(self._ui_state.get_attributes(key=self._attribute_image_key))
+        # Clingraph images can be declared with the image_type or the image key
+        attributes = []
+        for key in [self._attribute_image_key, "image"]:
+            attributes.extend(self._ui_state.get_attributes(key=key))
         for attribute in attributes:
             attribute_value = StandardTextProcessing.parse_string_with_quotes(
                 str(attribute.value)
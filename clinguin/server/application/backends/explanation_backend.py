@@ -127,12 +127,14 @@ class ExplanationBackend(ClingoMultishotBackend):
 
             assumptions (list[int]): List of assumption literals
         """
-        with self._ctl.solve(
-            assumptions=[(a, True) for a in assumptions], yield_=True
-        ) as solve_handle:
-            satisfiable = solve_handle.get().satisfiable
-            core = [self._lit2symbol[s] for s in solve_handle.core() if s != -1]
-        return satisfiable, core
+        core = []
+        # Stops after the first model, since only the satisfiability is needed
+        result = self._ctl.solve(
+            assumptions=[(a, True) for a in assumptions],
+            on_model=lambda m: False,
+            on_core=core.extend,
+        )
+        return result.satisfiable, [self._lit2symbol[s] for s in core if s != -1]
 
     def _get_minimum_uc(self, different_assumptions):
         """
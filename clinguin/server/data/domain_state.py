@@ -2,20 +2,6 @@
 Util functions for generating the domain state
 """
 
-from clingo.symbol import Function
-
-
-def tag(symbols, tag_name):
-    """
-    Adds a predicate around all the symbols
-    """
-    if tag_name is None:
-        return symbols
-    tagged = []
-    for s in symbols:
-        tagged.append(Function(tag_name, [s]))
-    return tagged
-
 
 def solve(ctl, assumptions, on_model=lambda m: None):
     """
@@ -23,11 +9,15 @@ def solve(ctl, assumptions, on_model=lambda m: None):
 
     Includes predicate  _clinguin_unsat/0
     """
-    with ctl.solve(assumptions=assumptions, yield_=True) as result:
-        model_symbols = None
-        for m in result:
-            on_model(m)
-            model_symbols = m.symbols(shown=True, atoms=True)
-        if model_symbols is None:
-            return None, result.core()
-    return model_symbols, None
+    # Holds only the symbols of the latest model
+    last = []
+    core = []
+
+    def _on_model(m):
+        on_model(m)
+        last[:] = [m.symbols(shown=True, atoms=True)]
+
+    ctl.solve(assumptions=assumptions, on_model=_on_model, on_core=core.extend)
+    if len(last) == 0:
+        return None, core
+    return last[0], None
@@ -4,6 +4,7 @@ Module that contains the UI State class.
 """
 import logging
 import os
+from functools import singledispatch
 from pathlib import Path
 
 import clorm
@@ -20,6 +21,48 @@ from .element import ElementDao
 
 log = logging.getLogger("clinguin_server")
 
+_SHOW_PRG = "#show elem/3. #show attr/3. #show when/4."
+
+
+@singledispatch
+def _to_term(value):
+    """
+    Converts a string into a constant, other values are returned as they are.
+    """
+    return value
+
+
+@_to_term.register
+def _(value: str):
+    return Function(value, [])
+
+
+@singledispatch
+def _to_value(value):
+    """
+    Converts a string into a clingo string and an integer into a clingo number,
+    other values are returned as they are.
+    """
+    return value
+
+
+@_to_value.register
+def _(value: str):
+    return String(value)
+
+
+@_to_value.register
+def _(value: int):
+    return Number(value)
+
+
+def _element_dao(cid, t, parent):
+    return ElementDao(Raw(_to_term(cid)), Raw(_to_term(t)), Raw(_to_term(parent)))
+
+
+def _attribute_dao(cid, key, value):
+    return AttributeDao(Raw(_to_term(cid)), Raw(_to_term(key)), Raw(_to_value(value)))
+
 
 class UIState:
     """
@@ -27,6 +70,7 @@ class UIState:
     """
 
     unifiers = [ElementDao, AttributeDao, WhenDao]
+    window_type = Raw(Function("window", []))
 
     def __init__(
         self,
@@ -79,11 +123,11 @@ class UIState:
                 log.critical(str(e))
                 raise e
 
+        # Added as a single program to parse it in one go
+        prg = self._domain_state + "\n" + _SHOW_PRG
         if self._include_unsat_msg:
-            uictl.add("base", [], UIState.get_unsat_messages_ui_encoding())
-
-        uictl.add("base", [], self._domain_state)
-        uictl.add("base", [], "#show elem/3. #show attr/3. #show when/4.")
+            prg = UIState.get_unsat_messages_ui_encoding() + prg
+        uictl.add("base", [], prg)
         uictl.ground([("base", [])], ClingraphContext)
 
         return uictl
@@ -95,12 +139,16 @@ class UIState:
         log.debug("Computing UI state\n")
         uictl = self.ui_control()
 
-        with uictl.solve(yield_=True) as result:
-            for m in result:
-                model_symbols = m.symbols(shown=True, atoms=True)
-                break
+        models = []
 
-        self._factbase = clorm.unify(self.__class__.unifiers, model_symbols)
+        def on_model(m):
+            models.append(m.symbols(shown=True, atoms=True))
+            # Only the first model is needed
+            return False
+
+        uictl.solve(on_model=on_model)
+
+        self._factbase = clorm.unify(self.__class__.unifiers, models[0])
 
     def add_message(self, title, message, attribute_type="info"):
         """
@@ -108,7 +156,7 @@ class UIState:
         """
         windows = list(
             self._factbase.query(ElementDao)
-            .where(ElementDao.type == Raw(Function("window", [])))
+            .where(ElementDao.type == UIState.window_type)
             .all()
         )
         if len(windows) == 0:
@@ -116,10 +164,14 @@ class UIState:
                 "No window found to add message. Make sure an element of type window appears in your UI"
             )
         mid = f"{hash(message)}"
-        self.add_element(mid, "message", windows[0].symbol.arguments[0])
-        self.add_attribute(mid, "title", title)
-        self.add_attribute(mid, "message", message)
-        self.add_attribute(mid, "type", attribute_type)
+        self.add_elements([(mid, "message", windows[0].symbol.arguments[0])])
+        self.add_attributes(
+            [
+                (mid, "title", title),
+                (mid, "message", message),
+                (mid, "type", attribute_type),
+            ]
+        )
 
     # Manage factbase
 
@@ -127,27 +179,29 @@ class UIState:
         """
         Adds an element to the factbase.
         """
-        if isinstance(cid, str):
-            cid = Function(cid, [])
-        if isinstance(t, str):
-            t = Function(t, [])
-        if isinstance(parent, str):
-            parent = Function(parent, [])
-        self._factbase.add(ElementDao(Raw(cid), Raw(t), Raw(parent)))
+        self._factbase.add(_element_dao(cid, t, parent))
+
+    def add_elements(self, elements):
+        """
+        Adds several elements, given as (id, type, parent) tuples, to the factbase at once.
+        """
+        self._factbase.add(
+            [_element_dao(cid, t, parent) for cid, t, parent in elements]
+        )
 
     def add_attribute(self, cid, key, value):
         """
         Adds an attribute to the factbase.
         """
-        if isinstance(cid, str):
-            cid = Function(cid, [])
-        if isinstance(key, str):
-            key = Function(key, [])
-        if isinstance(value, str):
-            value = String(value)
-        if isinstance(value, int):
-            value = Number(value)
-        self._factbase.add(AttributeDao(Raw(cid), Raw(key), Raw(value)))
+        self._factbase.add(_attribute_dao(cid, key, value))
+
+    def add_attributes(self, attributes):
+        """
+        Adds several attributes, given as (id, key, value) tuples, to the factbase at once.
+        """
+        self._factbase.add(
+            [_attribute_dao(cid, key, value) for cid, key, value in attributes]
+        )
 
     def add_attribute_direct(self, new_attribute):
         """
@@ -163,11 +217,13 @@ class UIState:
 
     def get_attributes(self, key=None):
         """
-        Get all attributes.
+        Get all attributes, optionally only the ones with the given key.
         """
         q = self._factbase.query(AttributeDao)
         if key is not None:
-            q.where(AttributeDao.key == key)
+            if isinstance(key, str):
+                key = Function(key, [])
+            q = q.where(AttributeDao.key == Raw(key))
         return q.all()
 
     def get_callbacks(self):
@@ -216,17 +272,15 @@ class UIState:
         """
         Converts a iterable symbols to a string of facts.
         """
-        return "\n".join([str(s) + "." for s in symbols])
+        prg = ".\n".join(map(str, symbols))
+        return prg + "." if prg else prg
 
     def replace_images_with_b64(self, image_attribute_key="image"):
         """
         Replaces all images in the ui-state by b64
         """
-        attributes = list(self.get_attributes())
+        attributes = list(self.get_attributes(key=image_attribute_key))
         for attribute in attributes:
-            if str(attribute.key) != image_attribute_key:
-                continue
-
             attribute_value = StandardTextProcessing.parse_string_with_quotes(
                 str(attribute.value)
             )
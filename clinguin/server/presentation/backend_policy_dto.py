@@ -4,10 +4,33 @@ Module that contains the BackendPolicyDto
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import VERSION, BaseModel, Field
 
+PYDANTIC_V2 = int(VERSION.split(".", maxsplit=1)[0]) >= 2
 
-class ContextDto(BaseModel):
+if PYDANTIC_V2:
+    from pydantic import ConfigDict
+
+
+class _FrozenDto(BaseModel):
+    """
+    Base for the DTOs, which are immutable and ignore unknown fields.
+    """
+
+    if PYDANTIC_V2:
+        model_config = ConfigDict(frozen=True, extra="ignore")
+    else:
+
+        class Config:  # pylint: disable=R0903
+            """
+            Config class for pydantic v1
+            """
+
+            allow_mutation = False
+            extra = "ignore"
+
+
+class ContextDto(_FrozenDto):
     """
     Optional pass to the backend, which handles the context.
     """
@@ -16,10 +39,10 @@ class ContextDto(BaseModel):
     value: str
 
 
-class BackendPolicyDto(BaseModel):
+class BackendPolicyDto(_FrozenDto):
     """
     Needed by the endpoints to get convert the transported json into something useful for the backend.
     """
 
     function: str
-    context: Optional[List[ContextDto]] = []
+    context: Optional[List[ContextDto]] = Field(default_factory=list)
@@ -114,13 +114,13 @@ class Endpoints:
 
                 function_arguments = list(map(str, p.arguments))
 
-                call_args = ",".join(function_arguments)
-                self._logger.info(
-                    "--> %s:   %s(%s))",
-                    self._backend.__class__.__name__,
-                    function_name,
-                    call_args,
-                )
+                if self._logger.isEnabledFor(logging.INFO):
+                    self._logger.info(
+                        "--> %s:   %s(%s))",
+                        self._backend.__class__.__name__,
+                        function_name,
+                        ",".join(function_arguments),
+                    )
 
                 EndpointsHelper.call_function(
                     self._backend, function_name, function_arguments, {}
@@ -1,6 +1,3 @@
-import json
-
-
 class BasicTest05:
     @classmethod
     def get_reference_json(cls):
@@ -116,4 +113,4 @@ class BasicTest05:
             ],
         }
 
-        return json.loads(json.dumps(json_dict))
+        return json_dict
@@ -1,5 +1,10 @@
+from clingo import parse_term
 from utils_test_utils import UtilsTestUtils
 
+from clinguin.server.application.backends.clingraph_backend import ClingraphBackend
+from clinguin.server.data.ui_state import UIState
+from clinguin.utils import image_to_b64
+
 
 class TestClingraph:
     def setup_method(self, test_method):
@@ -54,3 +59,42 @@ class TestClingraph:
 
             UtilsTestUtils.assert_post_request(uri, received_by_postman, data)
     """
+
+
+class TestClingraphImageReplacement:
+    def setup_method(self, test_method):
+        self.ui_state = UIState([], "", [])
+        self.ui_state._set_fb_symbols(
+            [
+                parse_term(s)
+                for s in [
+                    "elem(window,window,root)",
+                    "elem(canv,canvas,window)",
+                    "attr(canv,image,clingraph__default)",
+                    "elem(canv2,canvas,window)",
+                    "attr(canv2,image_type,clingraph__default)",
+                    'attr(canv2,label,"clingraph")',
+                ]
+            ]
+        )
+
+        # Avoids the argument setup and graphviz rendering of the backend
+        self.backend = ClingraphBackend.__new__(ClingraphBackend)
+        self.backend._ui_state = self.ui_state
+        self.backend._attribute_image_key = "image_type"
+        self.backend._attribute_image_value = "clingraph"
+        self.backend._create_image_from_graph = lambda graphs, key=None: b"img"
+
+    def teardown_method(self, test_method):
+        pass
+
+    def test_image_key_and_image_type_key_are_replaced(self):
+        self.backend._replace_uifb_with_b64_images_clingraph({})
+
+        b64 = image_to_b64(b"img")
+        new_images = {
+            str(a.id)
+            for a in self.ui_state.get_attributes(key="image")
+            if str(a.value) == f'"{b64}"'
+        }
+        assert new_images == {"canv", "canv2"}
@@ -0,0 +1,25 @@
+from clinguin.parse_input import _collect_subclasses
+
+
+class TestParseInput:
+    def test_collect_subclasses_order(self):
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        class C(A):
+            pass
+
+        class D(B):
+            pass
+
+        class E(C):
+            pass
+
+        class F(D):
+            pass
+
+        names = [c.__name__ for c in _collect_subclasses(A)]
+        assert names == ["B", "C", "D", "F", "E"]
@@ -0,0 +1,79 @@
+from clingo import Function, parse_term
+
+from clinguin.server.data.ui_state import UIState
+
+
+class TestUIState:
+    def setup_method(self, test_method):
+        self.ui_state = UIState([], "", [])
+        self.ui_state._set_fb_symbols(
+            [
+                parse_term(s)
+                for s in [
+                    "elem(w,window,root)",
+                    'attr(w,image,"w.png")',
+                    'attr(w,label,"Window")',
+                    'attr(b,image,"b.png")',
+                    "attr(b,width,10)",
+                ]
+            ]
+        )
+
+    def teardown_method(self, test_method):
+        pass
+
+    def test_get_attributes_with_str_key(self):
+        attributes = self.ui_state.get_attributes(key="image")
+        assert sorted(str(a) for a in attributes) == [
+            'attr(b,image,"b.png")',
+            'attr(w,image,"w.png")',
+        ]
+
+    def test_get_attributes_with_symbol_key(self):
+        attributes = self.ui_state.get_attributes(key=Function("image", []))
+        assert sorted(str(a) for a in attributes) == [
+            'attr(b,image,"b.png")',
+            'attr(w,image,"w.png")',
+        ]
+
+    def test_get_attributes_without_key(self):
+        assert len(list(self.ui_state.get_attributes())) == 4
+
+    def test_add_elements_and_attributes_bulk(self):
+        self.ui_state.add_elements(
+            [("c", "container", "w"), (Function("d", []), "button", Function("c", []))]
+        )
+        self.ui_state.add_attributes(
+            [
+                ("c", "label", "Text"),
+                ("c", "width", 20),
+                ("d", Function("class", []), Function("primary", [])),
+            ]
+        )
+
+        elements = {str(e) for e in self.ui_state.get_elements()}
+        assert "elem(c,container,w)" in elements
+        assert "elem(d,button,c)" in elements
+
+        attributes = {str(a) for a in self.ui_state.get_attributes()}
+        assert 'attr(c,label,"Text")' in attributes
+        assert "attr(c,width,20)" in attributes
+        assert "attr(d,class,primary)" in attributes
+
+    def test_add_message(self):
+        self.ui_state.add_message("Title", "Hello", "warning")
+
+        messages = list(self.ui_state.get_elements())
+        message = [e for e in messages if str(e.type) == "message"][0]
+        assert str(message.parent) == "w"
+
+        attributes = {
+            (str(a.key), str(a.value))
+            for a in self.ui_state.get_attributes()
+            if a.id == message.id
+        }
+        assert attributes == {
+            ("title", '"Title"'),
+            ("message", '"Hello"'),
+            ("type", '"warning"'),
+        }